@@ -8,15 +8,29 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import pandas as pd
-
 if TYPE_CHECKING:
+    import pandas as pd
+
     from benchmark_timer import BenchmarkTimer
 
 
 # Default database filename
 DEFAULT_DB_NAME = "benchmark_results.db"
 
+# Indices backing the filters used by load_benchmark_runs/load_benchmark_timings
+INDICES = {
+    "idx_runs_expname": ("benchmark_runs", "experiment_name"),
+    "idx_runs_runid": ("benchmark_runs", "run_id"),
+    "idx_timings_runid": ("benchmark_timings", "run_id"),
+    "idx_timings_expname": ("benchmark_timings", "experiment_name"),
+}
+
+# Run IDs bound per "run_id IN (...)" query; older SQLite builds allow 999 parameters
+MAX_IN_PARAMS = 900
+
+# Timing columns cast to REAL when loaded; older runs may have stored them as text
+NUMERIC_TIMING_COLUMNS = ("stage_metadata.num_gpus",)
+
 
 def get_database_path() -> Path:
     """Return path to benchmark_results.db in project root.
@@ -32,8 +46,50 @@ def get_database_path() -> Path:
     return project_root / DEFAULT_DB_NAME
 
 
+def _connect(db_path: Path, durable: bool = False, read_only: bool = False) -> sqlite3.Connection:
+    """Open a SQLite connection with the PRAGMAs used for benchmark databases.
+
+    Parameters
+    ----------
+    db_path : Path
+        Path to the database file.
+    durable : bool
+        If True, use synchronous=FULL so that every commit survives power loss.
+        The default, NORMAL, is safe against application crashes under WAL.
+    read_only : bool
+        If True, leave the database file untouched: the journal mode is not
+        changed, no indices are created and PRAGMA query_only rejects writes.
+
+    Returns
+    -------
+    sqlite3.Connection
+        SQLite database connection.
+    """
+    conn = sqlite3.connect(db_path)
+    # Keep temporary tables in memory, use a 64 MB page cache and 256 MB mmap
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA mmap_size=268435456")
+    if read_only:
+        conn.execute("PRAGMA query_only=1")
+        return conn
+
+    # WAL lets readers proceed during writes; NORMAL sync is safe under WAL
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(f"PRAGMA synchronous={'FULL' if durable else 'NORMAL'}")
+    try:
+        _create_indices(conn)
+    except sqlite3.OperationalError:
+        pass  # e.g. a read-only database; lookups still work, only slower
+    return conn
+
+
 @contextmanager
-def get_database_connection(db_path: Path | None = None):
+def get_database_connection(
+    db_path: Path | None = None,
+    durable: bool = False,
+    read_only: bool = False,
+):
     """Context manager for SQLite database connection.
 
     Parameters
@@ -41,6 +97,10 @@ def get_database_connection(db_path: Path | None = None):
     db_path : Path | None
         Path to the database file. If None, uses the default path
         returned by get_database_path().
+    durable : bool
+        If True, use synchronous=FULL instead of NORMAL.
+    read_only : bool
+        If True, the connection rejects writes (PRAGMA query_only).
 
     Yields
     ------
@@ -50,13 +110,23 @@ def get_database_connection(db_path: Path | None = None):
     if db_path is None:
         db_path = get_database_path()
 
-    conn = sqlite3.connect(db_path)
+    conn = _connect(db_path, durable=durable, read_only=read_only)
     try:
         yield conn
     finally:
         conn.close()
 
 
+@contextmanager
+def _borrowed_connection(conn: sqlite3.Connection | None, db_path: Path | None):
+    """Yield ``conn`` if given, otherwise a new read-only connection closed on exit."""
+    if conn is not None:
+        yield conn
+    else:
+        with get_database_connection(db_path, read_only=True) as new_conn:
+            yield new_conn
+
+
 def save_experiment_results(
     timer: BenchmarkTimer,
     results: dict[str, Any],
@@ -85,7 +155,8 @@ def save_experiment_results(
     # Record total time before saving
     timer.record_total_time()
 
-    with get_database_connection(db_path) as conn:
+    # The inner ``conn`` context commits once on success and rolls back on error
+    with get_database_connection(db_path) as conn, conn:
         # Save timing data
         timer.to_sql(conn, table="benchmark_timings")
 
@@ -111,48 +182,192 @@ def save_experiment_results(
             if isinstance(value, (list, dict)):
                 run_summary[key] = json.dumps(value, default=str)
 
-        df_run = pd.DataFrame([run_summary])
-        _save_dataframe_with_schema_evolution(df_run, conn, "benchmark_runs")
+        _save_records_with_schema_evolution([run_summary], conn, "benchmark_runs")
 
-        conn.commit()
+        _create_indices(conn)
 
     print(f"Results saved to {get_database_path() if db_path is None else db_path}")
 
 
-def _save_dataframe_with_schema_evolution(
-    df: pd.DataFrame,
+def _create_indices(conn: sqlite3.Connection) -> None:
+    """Create the lookup indices in INDICES for every table that exists."""
+    cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    tables = {row[0] for row in cursor.fetchall()}
+    for index_name, (table, column) in INDICES.items():
+        if table in tables:
+            conn.execute(f'CREATE INDEX IF NOT EXISTS {index_name} ON "{table}"("{column}")')
+
+
+def _projection(columns: list[str] | None, numeric: tuple[str, ...] = ()) -> str:
+    """Return the SELECT column list for the given columns, or '*' for all.
+
+    Integer and real values of the columns listed in ``numeric`` are cast to
+    REAL by SQLite, keeping the column name. Other values are passed through
+    unchanged, since CAST would turn non-numeric text into 0.0.
+    """
+    if not columns:
+        return "*"
+    return ", ".join(
+        f"CASE WHEN typeof(\"{column}\") IN ('integer', 'real') "
+        f'THEN CAST("{column}" AS REAL) ELSE "{column}" END AS "{column}"'
+        if column in numeric else f'"{column}"'
+        for column in columns
+    )
+
+
+def _first_dataset(datasets_json: str | None) -> str | None:
+    """Return the first dataset name from a JSON list of datasets, or None."""
+    if not isinstance(datasets_json, str):
+        return None
+    try:
+        datasets = json.loads(datasets_json)
+        if datasets:
+            return str(datasets[0])
+    except (json.JSONDecodeError, TypeError, IndexError, KeyError):
+        pass
+    return None
+
+
+def _with_first_dataset(df: pd.DataFrame) -> pd.DataFrame:
+    """Add a ``_first_dataset`` column parsed from the ``datasets`` JSON column.
+
+    Each distinct JSON string is parsed only once; runs of the same
+    experiment usually share the value.
+    """
+    if "datasets" not in df.columns:
+        return df
+    unique_datasets = df["datasets"].dropna().unique()
+    first_datasets = {value: _first_dataset(value) for value in unique_datasets}
+    return df.assign(_first_dataset=df["datasets"].map(first_datasets))
+
+
+def _table_columns(conn: sqlite3.Connection, table: str) -> list[str]:
+    """Return the column names of a table, or an empty list if it does not exist."""
+    cursor = conn.execute(f'PRAGMA table_info("{table}")')
+    return [row[1] for row in cursor.fetchall()]
+
+
+def _table_projection(
     conn: sqlite3.Connection,
     table: str,
+    columns: list[str] | None,
+    numeric: tuple[str, ...] = (),
+) -> str | None:
+    """Return the SELECT column list for the columns that exist in a table.
+
+    Requested columns that an older database does not have yet are skipped,
+    so projecting never turns a load into an error. If none of them exist,
+    None is returned rather than widening the projection to '*'. If
+    ``numeric`` columns are given, '*' is expanded so that they can be cast.
+    """
+    if columns or numeric:
+        existing = _table_columns(conn, table)
+        if not columns:
+            columns = existing
+        elif existing:
+            existing_set = set(existing)
+            columns = [column for column in columns if column in existing_set]
+            if not columns:
+                return None
+    return _projection(columns, numeric)
+
+
+def _insert_records(
+    conn: sqlite3.Connection,
+    table: str,
+    records: list[dict[str, Any]],
 ) -> None:
-    """Save DataFrame to SQLite with automatic schema evolution.
+    """Append records to an existing table with a single executemany call.
 
     Parameters
     ----------
-    df : pd.DataFrame
-        DataFrame to save.
+    conn : sqlite3.Connection
+        SQLite database connection.
+    table : str
+        Name of the table. All record keys must already be columns of it.
+    records : list[dict[str, Any]]
+        Rows to insert. Keys missing from a record are stored as NULL.
+    """
+    columns = list(dict.fromkeys(key for record in records for key in record))
+    column_list = ", ".join(f'"{column}"' for column in columns)
+    placeholders = ", ".join("?" * len(columns))
+    conn.executemany(
+        f'INSERT INTO "{table}" ({column_list}) VALUES ({placeholders})',
+        [tuple(record.get(column) for column in columns) for record in records],
+    )
+
+
+def _add_missing_columns(
+    conn: sqlite3.Connection,
+    table: str,
+    columns: list[str],
+) -> None:
+    """Add columns that are missing from an existing table.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        SQLite database connection.
+    table : str
+        Name of the table. Nothing happens if the table does not exist yet.
+    columns : list[str]
+        Column names that the table must provide.
+
+    Notes
+    -----
+    Columns are added without a declared type so that values keep their
+    own storage class. ``ALTER TABLE ... ADD COLUMN`` does not rewrite the
+    existing rows.
+    """
+    existing = set(_table_columns(conn, table))
+    if not existing:
+        return
+
+    for column in columns:
+        if column not in existing:
+            conn.execute(f'ALTER TABLE "{table}" ADD COLUMN "{column}"')
+
+
+def _save_records_with_schema_evolution(
+    records: list[dict[str, Any]],
+    conn: sqlite3.Connection,
+    table: str,
+) -> None:
+    """Save records to SQLite with automatic schema evolution.
+
+    Parameters
+    ----------
+    records : list[dict[str, Any]]
+        Rows to save, with values already serialized for SQLite.
     conn : sqlite3.Connection
         SQLite database connection.
     table : str
         Name of the table.
+
+    Notes
+    -----
+    Existing tables are appended to directly with ``executemany``; pandas is
+    only used to create the table on first write.
     """
-    if len(df) == 0:
+    if len(records) == 0:
         return
 
-    try:
-        df.to_sql(table, conn, if_exists="append", index=False)
-    except sqlite3.OperationalError as error:
-        if "has no column" in str(error):
-            # Schema evolution: merge with existing data
-            df_existing = pd.read_sql(f"SELECT * FROM '{table}'", conn)
-            df = pd.concat([df_existing, df], ignore_index=True, sort=False)
-            df.to_sql(table, conn, if_exists="replace", index=False)
-        else:
-            raise
+    if _table_columns(conn, table):
+        columns = list(dict.fromkeys(key for record in records for key in record))
+        _add_missing_columns(conn, table, columns)
+        _insert_records(conn, table, records)
+    else:
+        import pandas as pd
+
+        pd.DataFrame(records).to_sql(table, conn, if_exists="append", index=False)
 
 
 def load_benchmark_runs(
     experiment_name: str | None = None,
     db_path: Path | None = None,
+    columns: list[str] | None = None,
+    conn: sqlite3.Connection | None = None,
+    run_id_prefix: str | None = None,
 ) -> pd.DataFrame:
     """Load benchmark run summaries from the database.
 
@@ -162,19 +377,85 @@ def load_benchmark_runs(
         Filter by experiment name. If None, loads all runs.
     db_path : Path | None
         Path to the database file. If None, uses default path.
+    columns : list[str] | None
+        Columns to load. If None, loads all columns, including the large
+        python.pip_freeze and results_json values. Columns missing from the
+        table are skipped; if none exist, an empty DataFrame is returned.
+    conn : sqlite3.Connection | None
+        Open connection to reuse. If given, db_path is ignored.
+    run_id_prefix : str | None
+        Filter by run IDs starting with this prefix.
 
     Returns
     -------
     pd.DataFrame
-        DataFrame containing benchmark run summaries.
+        DataFrame containing benchmark run summaries. If ``datasets`` is
+        loaded, a ``_first_dataset`` column holds the first dataset name.
     """
-    with get_database_connection(db_path) as conn:
+    import pandas as pd
+
+    with _borrowed_connection(conn, db_path) as conn:
         try:
+            projection = _table_projection(conn, "benchmark_runs", columns)
+            if projection is None:
+                return pd.DataFrame()
+            query = f"SELECT {projection} FROM benchmark_runs WHERE 1=1"
+            params = []
+
             if experiment_name:
-                query = f"SELECT * FROM benchmark_runs WHERE experiment_name = ?"
-                return pd.read_sql(query, conn, params=(experiment_name,))
-            else:
-                return pd.read_sql("SELECT * FROM benchmark_runs", conn)
+                query += " AND experiment_name = ?"
+                params.append(experiment_name)
+            if run_id_prefix:
+                query += " AND run_id >= ? AND run_id < ?"
+                params.extend([run_id_prefix, run_id_prefix + "\uffff"])
+
+            df = pd.read_sql(query, conn, params=params if params else None)
+        except pd.io.sql.DatabaseError:
+            return pd.DataFrame()
+    return _with_first_dataset(df)
+
+
+def load_run_by_prefix(
+    run_id_prefix: str,
+    limit: int = 2,
+    db_path: Path | None = None,
+    conn: sqlite3.Connection | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """Load the runs whose run_id starts with a prefix.
+
+    Parameters
+    ----------
+    run_id_prefix : str
+        Prefix of the run ID to look up.
+    limit : int
+        Maximum number of runs to load. The default of 2 is enough to tell
+        a unique match from an ambiguous prefix.
+    db_path : Path | None
+        Path to the database file. If None, uses default path.
+    conn : sqlite3.Connection | None
+        Open connection to reuse. If given, db_path is ignored.
+    columns : list[str] | None
+        Columns to load. If None, loads all columns. Columns missing from
+        the table are skipped; if none exist, an empty DataFrame is returned.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with the requested columns of the matching benchmark runs.
+    """
+    import pandas as pd
+
+    with _borrowed_connection(conn, db_path) as conn:
+        try:
+            projection = _table_projection(conn, "benchmark_runs", columns)
+            if projection is None:
+                return pd.DataFrame()
+            return pd.read_sql(
+                f"SELECT {projection} FROM benchmark_runs WHERE run_id >= ? AND run_id < ? LIMIT ?",
+                conn,
+                params=(run_id_prefix, run_id_prefix + "\uffff", limit),
+            )
         except pd.io.sql.DatabaseError:
             return pd.DataFrame()
 
@@ -183,6 +464,11 @@ def load_benchmark_timings(
     run_id: str | None = None,
     experiment_name: str | None = None,
     db_path: Path | None = None,
+    run_id_prefix: str | None = None,
+    columns: list[str] | None = None,
+    conn: sqlite3.Connection | None = None,
+    stage: str | None = None,
+    run_ids: list[str] | None = None,
 ) -> pd.DataFrame:
     """Load benchmark timing data from the database.
 
@@ -194,24 +480,226 @@ def load_benchmark_timings(
         Filter by experiment name.
     db_path : Path | None
         Path to the database file. If None, uses default path.
+    run_id_prefix : str | None
+        Filter by run IDs starting with this prefix.
+    columns : list[str] | None
+        Columns to load. If None, loads all columns. Columns missing from
+        the table are skipped; if none exist, an empty DataFrame is returned.
+    conn : sqlite3.Connection | None
+        Open connection to reuse. If given, db_path is ignored.
+    stage : str | None
+        Filter by stage name, e.g. "model_fit".
+    run_ids : list[str] | None
+        Filter by any of these run IDs.
 
     Returns
     -------
     pd.DataFrame
         DataFrame containing timing data.
     """
-    with get_database_connection(db_path) as conn:
+    import pandas as pd
+
+    with _borrowed_connection(conn, db_path) as conn:
         try:
-            query = "SELECT * FROM benchmark_timings WHERE 1=1"
+            projection = _table_projection(
+                conn, "benchmark_timings", columns, numeric=NUMERIC_TIMING_COLUMNS
+            )
+            if projection is None:
+                return pd.DataFrame()
+            query = f"SELECT {projection} FROM benchmark_timings WHERE 1=1"
             params = []
 
             if run_id:
                 query += " AND run_id = ?"
                 params.append(run_id)
+            if run_id_prefix:
+                # A range rather than LIKE, so that the run_id index is used
+                query += " AND run_id >= ? AND run_id < ?"
+                params.extend([run_id_prefix, run_id_prefix + "\uffff"])
             if experiment_name:
                 query += " AND experiment_name = ?"
                 params.append(experiment_name)
-
-            return pd.read_sql(query, conn, params=params if params else None)
+            if stage:
+                query += " AND stage = ?"
+                params.append(stage)
+            if run_ids is not None:
+                # Batched to stay under SQLite's limit on bound parameters
+                batches = [
+                    run_ids[i:i + MAX_IN_PARAMS] for i in range(0, len(run_ids), MAX_IN_PARAMS)
+                ] or [[]]
+                df = pd.concat(
+                    [
+                        pd.read_sql(
+                            query + f" AND run_id IN ({', '.join('?' * len(batch))})",
+                            conn,
+                            params=params + batch,
+                        )
+                        for batch in batches
+                    ],
+                    ignore_index=True,
+                )
+            else:
+                df = pd.read_sql(query, conn, params=params if params else None)
         except pd.io.sql.DatabaseError:
             return pd.DataFrame()
+
+    # Columns holding only numbers arrive as float; text values or an all-NULL
+    # column do not and are coerced here, unparseable text becoming NaN
+    for column in NUMERIC_TIMING_COLUMNS:
+        if column in df.columns and not pd.api.types.is_float_dtype(df[column]):
+            df[column] = pd.to_numeric(df[column], errors="coerce").astype("float64")
+    return df
+
+
+def load_model_results(
+    experiment_name: str | None = None,
+    db_path: Path | None = None,
+    conn: sqlite3.Connection | None = None,
+) -> pd.DataFrame:
+    """Load the per-model training and inference times from the runs' results_json.
+
+    results_json holds the column-oriented model results, so each key of
+    ``time_train_s`` is one result row. The values are extracted by SQLite's
+    JSON functions; only results_json that SQLite rejects, such as values
+    holding a bare NaN, is loaded and parsed in Python.
+
+    Parameters
+    ----------
+    experiment_name : str | None
+        Filter by experiment name. If None, loads the results of all runs.
+    db_path : Path | None
+        Path to the database file. If None, uses default path.
+    conn : sqlite3.Connection | None
+        Open connection to reuse. If given, db_path is ignored.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per model result with run_id, time_train_s and time_infer_s.
+        Runs whose results_json is missing or malformed have no rows.
+    """
+    import pandas as pd
+
+    # results_json that SQLite rejects is passed to json_each as NULL, which
+    # yields no rows; those values are parsed in Python below instead
+    query = """
+        SELECT r.run_id,
+               t.value AS time_train_s,
+               json_extract(r.results_json, '$.time_infer_s."' || t.key || '"') AS time_infer_s
+        FROM benchmark_runs AS r,
+             json_each(
+                 CASE WHEN json_valid(r.results_json) THEN r.results_json END, '$.time_train_s'
+             ) AS t
+        WHERE 1=1
+    """
+    # json.dumps writes missing metrics as a bare NaN, which SQLite's JSON1 rejects
+    fallback_query = """
+        SELECT run_id, results_json FROM benchmark_runs
+        WHERE results_json IS NOT NULL AND results_json != '' AND NOT json_valid(results_json)
+    """
+    params = []
+    if experiment_name:
+        query += " AND r.experiment_name = ?"
+        fallback_query += " AND experiment_name = ?"
+        params.append(experiment_name)
+
+    with _borrowed_connection(conn, db_path) as conn:
+        try:
+            df = pd.read_sql(query, conn, params=params if params else None)
+            fallback_rows = conn.execute(fallback_query, params).fetchall()
+        except (pd.io.sql.DatabaseError, sqlite3.OperationalError):
+            return pd.DataFrame()
+
+    records = [
+        record
+        for run_id, results_json in fallback_rows
+        for record in _model_result_records(run_id, results_json)
+    ]
+    if not records:
+        return df
+    df_fallback = pd.DataFrame(records, columns=["run_id", "time_train_s", "time_infer_s"])
+    if df.empty:
+        return df_fallback
+    return pd.concat([df, df_fallback], ignore_index=True)
+
+
+def _model_result_records(run_id: str, results_json: str) -> list[tuple[str, Any, Any]]:
+    """Parse one results_json with the json module into (run_id, train, infer) rows.
+
+    Unlike SQLite's JSON functions, json.loads accepts the NaN, Infinity and
+    -Infinity literals that json.dumps writes for missing or overflowing metrics.
+    """
+    try:
+        results = json.loads(results_json)
+    except (json.JSONDecodeError, TypeError):
+        return []
+    if not isinstance(results, dict):
+        return []
+    time_train = results.get("time_train_s")
+    time_infer = results.get("time_infer_s")
+    if not isinstance(time_train, dict):
+        return []
+    if not isinstance(time_infer, dict):
+        time_infer = {}
+    return [(run_id, value, time_infer.get(key)) for key, value in time_train.items()]
+
+
+def load_run_and_timing_by_prefix(
+    run_id_prefix: str,
+    db_path: Path | None = None,
+    conn: sqlite3.Connection | None = None,
+) -> tuple[list[tuple[str, str | None]], bool, bool, str | None]:
+    """Look up a run by run_id prefix together with its experiment_id.
+
+    Parameters
+    ----------
+    run_id_prefix : str
+        Prefix of the run ID to look up.
+    db_path : Path | None
+        Path to the database file. If None, uses default path.
+    conn : sqlite3.Connection | None
+        Open connection to reuse. If given, db_path is ignored.
+
+    Returns
+    -------
+    tuple[list[tuple[str, str | None]], bool, bool, str | None]
+        The ``(run_id, datasets)`` rows matching the prefix, at most two so
+        that an ambiguous prefix can be detected; whether the database holds
+        any run at all; whether timing data with an experiment_id column
+        exists for the run if exactly one run matches; and the experiment_id
+        recorded in those timings, if any.
+
+    Notes
+    -----
+    The lookups are served by the run_id indices and return plain tuples,
+    so the cost does not grow with the number of stored runs.
+    """
+    with _borrowed_connection(conn, db_path) as conn:
+        try:
+            cursor = conn.execute(
+                "SELECT run_id, datasets FROM benchmark_runs"
+                " WHERE run_id >= ? AND run_id < ? LIMIT 2",
+                (run_id_prefix, run_id_prefix + "\uffff"),
+            )
+            matches = cursor.fetchall()
+            has_runs = bool(matches) or bool(
+                conn.execute("SELECT EXISTS(SELECT 1 FROM benchmark_runs)").fetchone()[0]
+            )
+        except sqlite3.OperationalError:
+            return [], False, False, None
+
+        if len(matches) != 1:
+            return matches, has_runs, False, None
+
+        try:
+            # Prefer a timing row with an experiment_id, but any row shows timings exist
+            cursor = conn.execute(
+                'SELECT "stage_metadata.experiment_id" FROM benchmark_timings WHERE run_id = ?'
+                ' ORDER BY "stage_metadata.experiment_id" IS NULL LIMIT 1',
+                (matches[0][0],),
+            )
+            row = cursor.fetchone()
+        except sqlite3.OperationalError:
+            row = None
+
+    return matches, has_runs, row is not None, row[0] if row else None
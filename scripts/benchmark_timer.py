@@ -3,17 +3,17 @@
 from __future__ import annotations
 
 import json
-import sqlite3
 from contextlib import contextmanager
-from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime
 from time import perf_counter_ns
 from typing import Any
 from uuid import uuid4
 
+import numpy as np
 import pandas as pd
 
+from benchmark_db import _save_records_with_schema_evolution
 from benchmark_util import collect_all_metadata
 
 
@@ -22,10 +22,21 @@ def _with_prefix(prefix: str, mapping: dict) -> dict:
     return {f"{prefix}{key}": value for key, value in mapping.items()}
 
 
+# Context keys stored once per run in benchmark_runs rather than on every timing row
+RUN_ONLY_CONTEXT_KEYS = frozenset({
+    "python.pip_freeze",
+    "cuda.cuda_device_names",
+    "git.git_dirty",
+})
+
+# Shared encoder, equivalent to json.dumps(value, default=str)
+_ENCODER = json.JSONEncoder(default=str).encode
+
+
 def _serialize_for_sqlite(value: Any) -> Any:
     """Serialize non-primitive types to JSON strings for SQLite storage."""
     if isinstance(value, (list, dict)):
-        return json.dumps(value, default=str)
+        return _ENCODER(value)
     return value
 
 
@@ -50,7 +61,9 @@ class BenchmarkTimer:
     context : dict
         Environment metadata collected at initialization.
     timings : list
-        List of timing records for each timed stage.
+        List of timing records for each timed stage. Built on access from
+        the columnar storage used internally; durations are given in
+        ``time_ns`` only.
 
     Examples
     --------
@@ -68,13 +81,27 @@ class BenchmarkTimer:
     metadata: dict = field(default_factory=dict)
     run_id: str = field(default_factory=lambda: uuid4().hex)
     context: dict = field(default_factory=dict, init=False)
-    timings: list = field(default_factory=list, init=False)
     _start_time: float = field(default=0.0, init=False)
+    _start_datetime: datetime | None = field(default=None, init=False)
+    _context_serialized: dict = field(default_factory=dict, init=False)
+    # Timings are stored column-wise, one entry per timed stage
+    _stages: list = field(default_factory=list, init=False)
+    _ns: list = field(default_factory=list, init=False)
+    _end_ns: list = field(default_factory=list, init=False)
+    _stage_metadata: list = field(default_factory=list, init=False)
 
     def __post_init__(self):
         """Collect environment metadata and record start time."""
+        # Stage timestamps are derived from this pair instead of reading the clock each time
         self._start_time = perf_counter_ns()
+        self._start_datetime = datetime.now()
         self.context = collect_all_metadata()
+        # The context is the same for every row, so serialize it only once
+        self._context_serialized = {
+            key: _serialize_for_sqlite(value)
+            for key, value in self.context.items()
+            if key not in RUN_ONLY_CONTEXT_KEYS
+        }
 
     @contextmanager
     def time(self, stage: str, metadata: dict | None = None):
@@ -94,7 +121,7 @@ class BenchmarkTimer:
             Context manager that records timing on exit.
         """
         # Merge class-level metadata with stage-specific metadata
-        stage_metadata = deepcopy(self.metadata)
+        stage_metadata = dict(self.metadata)
         if metadata:
             stage_metadata.update(metadata)
 
@@ -102,46 +129,90 @@ class BenchmarkTimer:
         try:
             yield
         finally:
-            elapsed_ns = perf_counter_ns() - start
-            self.timings.append({
-                "stage": stage,
-                "time_ns": elapsed_ns,
-                "time_ms": elapsed_ns / 1e6,
-                "time_s": elapsed_ns / 1e9,
-                "timestamp": datetime.now().isoformat(),
-                **_with_prefix("stage_metadata.", stage_metadata),
-            })
+            end = perf_counter_ns()
+            self._append(stage, end - start, end, stage_metadata)
 
     def record_total_time(self):
         """Record the total elapsed time since timer initialization."""
-        total_ns = perf_counter_ns() - self._start_time
-        self.timings.append({
-            "stage": "total",
-            "time_ns": total_ns,
-            "time_ms": total_ns / 1e6,
-            "time_s": total_ns / 1e9,
-            "timestamp": datetime.now().isoformat(),
+        end = perf_counter_ns()
+        self._append("total", end - self._start_time, end, {})
+
+    def _append(self, stage: str, elapsed_ns: int, end_ns: int, stage_metadata: dict):
+        """Append one timing to the columnar storage."""
+        self._stages.append(stage)
+        self._ns.append(elapsed_ns)
+        self._end_ns.append(end_ns)
+        # Serialize metadata now so later mutations of the caller's values are not recorded
+        self._stage_metadata.append({
+            key: _serialize_for_sqlite(value)
+            for key, value in _with_prefix("stage_metadata.", stage_metadata).items()
         })
 
+    def _timestamps(self) -> list[str]:
+        """Return the ISO wall-clock time at which each stage ended."""
+        offsets = pd.to_timedelta(np.asarray(self._end_ns) - self._start_time, unit="ns")
+        end_times = pd.Timestamp(self._start_datetime) + offsets
+        return end_times.strftime("%Y-%m-%dT%H:%M:%S.%f").tolist()
+
+    @property
+    def timings(self) -> list[dict]:
+        """List of timing records, one dict per timed stage."""
+        return [
+            {
+                "stage": stage,
+                "time_ns": elapsed_ns,
+                "timestamp": timestamp,
+                **stage_metadata,
+            }
+            for stage, elapsed_ns, timestamp, stage_metadata in zip(
+                self._stages, self._ns, self._timestamps(), self._stage_metadata
+            )
+        ]
+
     def to_df(self) -> pd.DataFrame:
         """Convert timings and context to a DataFrame.
 
         Returns
         -------
         pd.DataFrame
-            DataFrame with one row per timed stage, including all context
-            metadata as columns.
+            DataFrame with one row per timed stage, including the context
+            metadata as columns except for RUN_ONLY_CONTEXT_KEYS.
         """
-        table = deepcopy(self.timings)
-        for row in table:
-            row["experiment_name"] = self.experiment_name
-            row["run_id"] = self.run_id
-            row.update(self.context)
-            # Serialize non-primitive types for SQLite compatibility
-            for key, value in row.items():
-                row[key] = _serialize_for_sqlite(value)
-
-        return pd.DataFrame(table)
+        if not self._stages:
+            return pd.DataFrame()
+
+        time_ns = np.asarray(self._ns, dtype=np.int64)
+        df = pd.DataFrame({
+            "stage": self._stages,
+            "time_ns": time_ns,
+            "time_ms": time_ns / 1e6,
+            "time_s": time_ns / 1e9,
+            "timestamp": self._timestamps(),
+        })
+        df = pd.concat([df, pd.DataFrame(self._stage_metadata)], axis=1)
+        # Identifiers and context are constant, so broadcast them as scalars
+        return df.assign(
+            experiment_name=self.experiment_name,
+            run_id=self.run_id,
+            **self._context_serialized,
+        )
+
+    def _records(self) -> list[dict]:
+        """Return one serialized record per timed stage, including context."""
+        return [
+            {
+                "stage": timing["stage"],
+                "time_ns": timing["time_ns"],
+                # Derived units are stored too, since readers query them directly
+                "time_ms": timing["time_ns"] / 1e6,
+                "time_s": timing["time_ns"] / 1e9,
+                **timing,
+                "experiment_name": self.experiment_name,
+                "run_id": self.run_id,
+                **self._context_serialized,
+            }
+            for timing in self.timings
+        ]
 
     def summary(self) -> str:
         """Return a human-readable summary of timing results.
@@ -182,21 +253,7 @@ class BenchmarkTimer:
 
         Notes
         -----
-        If the table exists but has different columns, the table schema
-        will be updated to accommodate new columns.
+        If the table exists but has different columns, the missing columns
+        are added in place with ``ALTER TABLE``; existing rows are not rewritten.
         """
-        df = self.to_df()
-
-        if len(df) == 0:
-            return  # nothing to store
-
-        try:
-            df.to_sql(table, conn, if_exists="append", index=False)
-        except sqlite3.OperationalError as error:
-            if "has no column" in str(error):
-                # Schema evolution: merge with existing data
-                df_existing = pd.read_sql(f"SELECT * FROM '{table}'", conn)
-                df = pd.concat([df_existing, df], ignore_index=True, sort=False)
-                df.to_sql(table, conn, if_exists="replace", index=False)
-            else:
-                raise
+        _save_records_with_schema_evolution(self._records(), conn, table)
@@ -2,22 +2,29 @@
 
 from __future__ import annotations
 
+import ctypes
+import functools
 import getpass
+import importlib.metadata
 import json
 import os
 import platform
 import socket
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-import git
-import psutil
+# Environment snapshots keyed by git search path, reused across timers
+_METADATA_CACHE: dict[Path | None, dict] = {}
 
 
+@functools.lru_cache(maxsize=1)
 def get_system_info() -> dict:
     """Collect OS, architecture, CPU count, total RAM, user, hostname."""
+    import psutil
+
     try:
         user = getpass.getuser()
     except Exception:
@@ -26,23 +33,78 @@ def get_system_info() -> dict:
         except OSError:
             user = None
 
+    uname = platform.uname()
+    memory = psutil.virtual_memory()
+
     return {
-        "os": platform.system(),
-        "os_release": platform.release(),
-        "os_version": platform.version(),
-        "architecture": platform.machine(),
-        "processor": platform.processor(),
+        "os": uname.system,
+        "os_release": uname.release,
+        "os_version": uname.version,
+        "architecture": uname.machine,
+        "processor": uname.processor,
         "hostname": socket.gethostname(),
         "user": user,
         "cpu_count": psutil.cpu_count(logical=True),
         "cpu_count_physical": psutil.cpu_count(logical=False),
-        "total_ram_bytes": psutil.virtual_memory().total,
-        "available_ram_bytes": psutil.virtual_memory().available,
+        "total_ram_bytes": memory.total,
+        "available_ram_bytes": memory.available,
+    }
+
+
+def _format_cuda_version(version: int) -> str:
+    """Format a CUDA version integer such as 12040 as '12.4'."""
+    return f"{version // 1000}.{version % 1000 // 10}"
+
+
+def _get_cuda_runtime_version() -> str | None:
+    """Query the CUDA runtime version from libcudart without creating a context."""
+    for name in ("libcudart.so", "libcudart.so.13", "libcudart.so.12"):
+        try:
+            libcudart = ctypes.CDLL(name)
+        except OSError:
+            continue
+        version = ctypes.c_int()
+        if libcudart.cudaRuntimeGetVersion(ctypes.byref(version)) == 0:
+            return _format_cuda_version(version.value)
+    return None
+
+
+def _get_cuda_info_nvml() -> dict:
+    """Collect CUDA device info through NVML, which does not initialize CUDA."""
+    import pynvml
+
+    pynvml.nvmlInit()
+    try:
+        device_count = pynvml.nvmlDeviceGetCount()
+        device_names = []
+        for i in range(device_count):
+            name = pynvml.nvmlDeviceGetName(pynvml.nvmlDeviceGetHandleByIndex(i))
+            device_names.append(name.decode() if isinstance(name, bytes) else name)
+        driver_cuda_version = pynvml.nvmlSystemGetCudaDriverVersion()
+    finally:
+        pynvml.nvmlShutdown()
+
+    return {
+        "cuda_available": device_count > 0,
+        "cuda_device_count": device_count,
+        "cuda_device_names": json.dumps(device_names),
+        # Prefer the runtime version, which is what numba reports
+        "cuda_version": _get_cuda_runtime_version() or _format_cuda_version(driver_cuda_version),
     }
 
 
+@functools.lru_cache(maxsize=1)
 def get_cuda_info() -> dict:
-    """Collect CUDA device count, device names, CUDA version."""
+    """Collect CUDA device count, device names, CUDA version.
+
+    Uses NVML when available and only falls back to numba, whose first
+    CUDA call initializes the driver, if that fails.
+    """
+    try:
+        return _get_cuda_info_nvml()
+    except Exception:
+        pass
+
     try:
         from numba import cuda
 
@@ -66,17 +128,16 @@ def get_cuda_info() -> dict:
         }
 
 
+@functools.lru_cache(maxsize=1)
 def get_python_info() -> dict:
     """Collect Python version and pip freeze snapshot."""
-    # Get pip freeze output
+    # Build pip freeze style output from the installed distributions
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "pip", "freeze"],
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-        pip_freeze = result.stdout.strip() if result.returncode == 0 else None
+        packages = {
+            f"{dist.metadata['Name']}=={dist.version}"
+            for dist in importlib.metadata.distributions()
+        }
+        pip_freeze = "\n".join(sorted(packages, key=str.lower))
     except Exception:
         pip_freeze = None
 
@@ -88,9 +149,92 @@ def get_python_info() -> dict:
     }
 
 
+def _find_git_dir(search_path: Path | None = None) -> tuple[Path, Path] | None:
+    """Locate the git directory and working tree containing search_path."""
+    start = Path(search_path or Path.cwd()).resolve()
+    for working_dir in (start, *start.parents):
+        dot_git = working_dir / ".git"
+        if dot_git.is_dir():
+            return dot_git, working_dir
+        if dot_git.is_file():
+            # Worktrees and submodules use a "gitdir: <path>" pointer file
+            content = dot_git.read_text().strip()
+            if content.startswith("gitdir:"):
+                git_dir = Path(content.split(":", 1)[1].strip())
+                return (working_dir / git_dir).resolve(), working_dir
+    return None
+
+
+def _resolve_ref(git_dir: Path, ref: str) -> str | None:
+    """Resolve a ref such as refs/heads/main to its commit SHA."""
+    # Linked worktrees keep shared refs in the common git directory
+    common_dir = git_dir
+    if (git_dir / "commondir").is_file():
+        common_dir = (git_dir / (git_dir / "commondir").read_text().strip()).resolve()
+
+    for base in dict.fromkeys((git_dir, common_dir)):
+        ref_path = base / ref
+        if ref_path.is_file():
+            return ref_path.read_text().strip()
+
+    packed_refs = common_dir / "packed-refs"
+    if packed_refs.is_file():
+        for line in packed_refs.read_text().splitlines():
+            if line.endswith(f" {ref}"):
+                return line.split(" ", 1)[0]
+    return None
+
+
+def _get_git_dirty(working_dir: Path) -> bool | None:
+    """Return whether tracked files have uncommitted changes."""
+    try:
+        result = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=working_dir,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+    except Exception:
+        return None
+    return bool(result.stdout.strip()) if result.returncode == 0 else None
+
+
 def get_git_info(search_path: Path | None = None) -> dict:
-    """Collect commit SHA and dirty status of the current repository."""
+    """Collect commit SHA and dirty status of the current repository.
+
+    HEAD is read directly from the git directory; GitPython is only used
+    as a fallback when that fails.
+    """
+    try:
+        location = _find_git_dir(search_path)
+        if location is None:
+            raise FileNotFoundError(f"No git repository found from {search_path or Path.cwd()}")
+        git_dir, working_dir = location
+
+        head = (git_dir / "HEAD").read_text().strip()
+        if head.startswith("ref:"):
+            ref = head.split(":", 1)[1].strip()
+            commit = _resolve_ref(git_dir, ref)
+            branch = ref.removeprefix("refs/heads/")
+        else:
+            commit = head
+            branch = None
+        if commit is None:
+            raise ValueError(f"Could not resolve git HEAD in {git_dir}")
+
+        return {
+            "git_commit": commit,
+            "git_branch": branch,
+            "git_dirty": _get_git_dirty(working_dir),
+            "git_working_dir": str(working_dir),
+        }
+    except Exception:
+        pass
+
     try:
+        import git
+
         repo = git.Repo(search_path, search_parent_directories=True)
         return {
             "git_commit": str(repo.head.commit),
@@ -108,38 +252,50 @@ def get_git_info(search_path: Path | None = None) -> dict:
         }
 
 
-def collect_all_metadata(search_path: Path | None = None) -> dict:
+def collect_all_metadata(search_path: Path | None = None, refresh: bool = False) -> dict:
     """Aggregate all metadata with execution timestamp.
 
+    The environment snapshot is collected once per process and search path;
+    subsequent calls only refresh the execution timestamp.
+
     Parameters
     ----------
     search_path : Path | None
         Optional path to search for git repository. If None, uses current directory.
+    refresh : bool
+        If True, discard any cached snapshot and collect the metadata again.
 
     Returns
     -------
     dict
         Dictionary containing all collected metadata with prefixed keys.
     """
-    metadata = {
-        "execution_datetime": datetime.now().isoformat(),
-        "execution_timestamp": datetime.now().timestamp(),
-    }
+    if refresh:
+        _METADATA_CACHE.clear()
+        get_system_info.cache_clear()
+        get_cuda_info.cache_clear()
+        get_python_info.cache_clear()
 
-    # Add system info with prefix
-    for key, value in get_system_info().items():
-        metadata[f"system.{key}"] = value
+    if search_path not in _METADATA_CACHE:
+        # The collectors are mostly I/O bound (driver init, filesystem, git),
+        # so run them concurrently and merge in a fixed prefix order
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                "system": executor.submit(get_system_info),
+                "cuda": executor.submit(get_cuda_info),
+                "python": executor.submit(get_python_info),
+                "git": executor.submit(get_git_info, search_path),
+            }
 
-    # Add CUDA info with prefix
-    for key, value in get_cuda_info().items():
-        metadata[f"cuda.{key}"] = value
+        environment = {}
+        for prefix, future in futures.items():
+            for key, value in future.result().items():
+                environment[f"{prefix}.{key}"] = value
 
-    # Add Python info with prefix
-    for key, value in get_python_info().items():
-        metadata[f"python.{key}"] = value
+        _METADATA_CACHE[search_path] = environment
 
-    # Add git info with prefix
-    for key, value in get_git_info(search_path).items():
-        metadata[f"git.{key}"] = value
-
-    return metadata
+    return {
+        "execution_datetime": datetime.now().isoformat(),
+        "execution_timestamp": datetime.now().timestamp(),
+        **_METADATA_CACHE[search_path],
+    }
@@ -7,7 +7,7 @@ and updates the stage_metadata.experiment_id column in the benchmark_timings tab
 
 from __future__ import annotations
 
-import json
+import re
 import sqlite3
 import sys
 from pathlib import Path
@@ -17,7 +17,29 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 import pandas as pd
 
-from benchmark_db import get_database_path
+from benchmark_db import _connect, _first_dataset, get_database_path
+
+# Rows read from benchmark_timings per chunk, and rows staged per executemany
+READ_CHUNK_SIZE = 50_000
+UPDATE_BATCH_SIZE = 10_000
+
+# Apply the staged (experiment_id, rid) pairs in one statement; UPDATE ... FROM needs SQLite 3.33
+if sqlite3.sqlite_version_info >= (3, 33, 0):
+    UPDATE_FROM_STAGED_SQL = """
+        UPDATE benchmark_timings SET "stage_metadata.experiment_id" = u.experiment_id
+        FROM temp.experiment_id_updates AS u WHERE benchmark_timings.rowid = u.rid
+    """
+else:
+    UPDATE_FROM_STAGED_SQL = """
+        UPDATE benchmark_timings SET "stage_metadata.experiment_id" = (
+            SELECT u.experiment_id FROM temp.experiment_id_updates AS u
+            WHERE u.rid = benchmark_timings.rowid
+        )
+        WHERE rowid IN (SELECT rid FROM temp.experiment_id_updates)
+    """
+
+# A uuid4().hex experiment_id
+_HEX32 = re.compile(r"[0-9a-fA-F]{32}")
 
 
 def extract_experiment_id(experiment_name: str, datasets_json: str | None) -> str | None:
@@ -41,28 +63,50 @@ def extract_experiment_id(experiment_name: str, datasets_json: str | None) -> st
         return None
     
     # Try to use datasets to find the suffix
-    if datasets_json:
-        try:
-            datasets = json.loads(datasets_json)
-            if datasets and len(datasets) > 0:
-                dataset = datasets[0]
-                suffix = f"_{dataset}"
-                if experiment_name.endswith(suffix):
-                    return experiment_name[:-len(suffix)]
-        except (json.JSONDecodeError, TypeError, IndexError):
-            pass
+    dataset = _first_dataset(datasets_json)
+    if dataset is not None:
+        suffix = f"_{dataset}"
+        if experiment_name.endswith(suffix):
+            return experiment_name[:-len(suffix)]
     
     # Fallback: assume experiment_id is a 32-char hex string at the start
     # Split on first underscore and check if first part looks like a UUID
     if "_" in experiment_name:
         first_part = experiment_name.split("_", 1)[0]
         # Check if it looks like a hex UUID (32 chars, all hex)
-        if len(first_part) == 32 and all(c in "0123456789abcdef" for c in first_part.lower()):
+        if _HEX32.fullmatch(first_part):
             return first_part
     
     return None
 
 
+def extract_experiment_ids(experiment_names: pd.Series, datasets: pd.Series) -> pd.Series:
+    """Vectorized version of extract_experiment_id.
+
+    Parameters
+    ----------
+    experiment_names : pd.Series
+        Full experiment names.
+    datasets : pd.Series
+        First dataset name for each row (aligned with experiment_names), or None.
+
+    Returns
+    -------
+    pd.Series
+        Extracted experiment_id per row, NaN where extraction fails.
+    """
+    # Fallback: a 32-char hex experiment_id followed by an underscore
+    experiment_ids = experiment_names.str.extract(f"^({_HEX32.pattern})_", expand=False)
+
+    # Strip the dataset suffix; there are few distinct datasets, so work per dataset
+    for dataset, names in experiment_names.groupby(datasets, sort=False):
+        suffix = f"_{dataset}"
+        matched = names[names.str.endswith(suffix, na=False)]
+        experiment_ids.loc[matched.index] = matched.str[:-len(suffix)]
+
+    return experiment_ids.where(experiment_ids != "")
+
+
 def migrate_experiment_ids(db_path: Path | None = None, dry_run: bool = False) -> None:
     """Migrate experiment_id values in the database.
     
@@ -80,7 +124,10 @@ def migrate_experiment_ids(db_path: Path | None = None, dry_run: bool = False) -
     print(f"Dry run: {dry_run}")
     print("=" * 60)
     
-    conn = sqlite3.connect(db_path)
+    conn = _connect(db_path)
+    # The staged updates can be large; let SQLite spill the TEMP table to disk
+    # instead of the in-memory temp_store that _connect sets for readers
+    conn.execute("PRAGMA temp_store=DEFAULT")
     
     try:
         # Check if the column exists
@@ -90,78 +137,98 @@ def migrate_experiment_ids(db_path: Path | None = None, dry_run: bool = False) -
         has_experiment_id_col = "stage_metadata.experiment_id" in columns
         print(f"Column 'stage_metadata.experiment_id' exists: {has_experiment_id_col}")
         
-        # Load timings data
-        df_timings = pd.read_sql("SELECT * FROM benchmark_timings", conn)
-        print(f"Total rows in benchmark_timings: {len(df_timings)}")
+        # Rows missing experiment_id; without the column, every row is missing it
+        missing_where = ' WHERE "stage_metadata.experiment_id" IS NULL' if has_experiment_id_col else ""
         
-        if df_timings.empty:
-            print("No data to migrate.")
+        # Cheap existence check first, so a re-run with nothing to do loads nothing
+        has_missing = conn.execute(
+            f"SELECT EXISTS(SELECT 1 FROM benchmark_timings{missing_where})"
+        ).fetchone()[0]
+        if not has_missing:
+            print("Nothing to migrate!" if has_experiment_id_col else "No data to migrate.")
             return
         
+        total_count = conn.execute("SELECT COUNT(*) FROM benchmark_timings").fetchone()[0]
+        print(f"Total rows in benchmark_timings: {total_count}")
+        
         # Load runs data to get datasets for each run_id
         df_runs = pd.read_sql("SELECT run_id, datasets FROM benchmark_runs", conn)
-        run_to_datasets = dict(zip(df_runs["run_id"], df_runs["datasets"]))
-        
-        # Find rows missing experiment_id
-        if has_experiment_id_col:
-            missing_mask = df_timings["stage_metadata.experiment_id"].isna()
-        else:
-            missing_mask = pd.Series([True] * len(df_timings))
-        
-        missing_count = missing_mask.sum()
+        # Parse each run's datasets JSON once, not once per timing row
+        run_to_first_dataset = {
+            run_id: _first_dataset(datasets_json)
+            for run_id, datasets_json in zip(df_runs["run_id"], df_runs["datasets"])
+        }
+        
+        missing_count = conn.execute(
+            f"SELECT COUNT(*) FROM benchmark_timings{missing_where}"
+        ).fetchone()[0]
         print(f"Rows missing experiment_id: {missing_count}")
         
-        if missing_count == 0:
-            print("Nothing to migrate!")
-            return
-        
-        # Extract experiment_id for missing rows
-        updates = []
-        for idx, row in df_timings[missing_mask].iterrows():
-            experiment_name = row.get("experiment_name", "")
-            run_id = row.get("run_id", "")
-            datasets_json = run_to_datasets.get(run_id)
+        if not dry_run:
+            # Apply updates in a single transaction
+            print("\nApplying updates...")
+            conn.execute("BEGIN")
             
-            experiment_id = extract_experiment_id(experiment_name, datasets_json)
+            # Add column if it doesn't exist; this must happen before the read cursor is opened
+            if not has_experiment_id_col:
+                print("Adding column 'stage_metadata.experiment_id'...")
+                conn.execute('ALTER TABLE benchmark_timings ADD COLUMN "stage_metadata.experiment_id" TEXT')
             
-            if experiment_id:
-                updates.append({
-                    "idx": idx,
-                    "run_id": run_id,
-                    "experiment_name": experiment_name,
-                    "experiment_id": experiment_id,
-                })
+            # Extracted values are staged here and applied with a single UPDATE at the end
+            conn.execute(
+                "CREATE TEMP TABLE experiment_id_updates (experiment_id TEXT, rid INTEGER PRIMARY KEY)"
+            )
         
-        print(f"Successfully extracted experiment_id for {len(updates)} rows")
+        stage_sql = "INSERT INTO temp.experiment_id_updates VALUES (?, ?)"
+        pending = []
+        extracted_count = 0
+        samples = []
+        
+        # Stream the rows missing experiment_id, loading only the columns needed
+        chunks = pd.read_sql(
+            f"SELECT rowid, experiment_name, run_id FROM benchmark_timings{missing_where}",
+            conn,
+            chunksize=READ_CHUNK_SIZE,
+        )
+        for df_missing in chunks:
+            # Extract experiment_id for missing rows as (experiment_id, rowid) parameters
+            datasets = df_missing["run_id"].map(run_to_first_dataset)
+            experiment_ids = extract_experiment_ids(df_missing["experiment_name"], datasets).dropna()
+            rowids = df_missing.loc[experiment_ids.index, "rowid"].tolist()
+            pending.extend(zip(experiment_ids.tolist(), rowids))
+            extracted_count += len(experiment_ids)
+            if len(samples) < 5:
+                samples.extend(zip(
+                    df_missing.loc[experiment_ids.index[:5 - len(samples)], "experiment_name"],
+                    experiment_ids.iloc[:5 - len(samples)],
+                ))
+            
+            if dry_run:
+                pending.clear()
+            elif len(pending) >= UPDATE_BATCH_SIZE:
+                conn.executemany(stage_sql, pending)
+                pending.clear()
+        
+        if not dry_run:
+            conn.executemany(stage_sql, pending)
+            conn.execute(UPDATE_FROM_STAGED_SQL)
+            conn.execute("DROP TABLE temp.experiment_id_updates")
+        
+        print(f"Successfully extracted experiment_id for {extracted_count} rows")
         
         # Show sample of updates
         print("\nSample updates:")
-        for update in updates[:5]:
-            print(f"  {update['experiment_name'][:50]}... -> {update['experiment_id']}")
-        if len(updates) > 5:
-            print(f"  ... and {len(updates) - 5} more")
+        for experiment_name, experiment_id in samples:
+            print(f"  {experiment_name[:50]}... -> {experiment_id}")
+        if extracted_count > 5:
+            print(f"  ... and {extracted_count - 5} more")
         
         if dry_run:
             print("\nDry run complete. No changes made.")
             return
         
-        # Apply updates
-        print("\nApplying updates...")
-        
-        # Add column if it doesn't exist
-        if not has_experiment_id_col:
-            print("Adding column 'stage_metadata.experiment_id'...")
-            conn.execute('ALTER TABLE benchmark_timings ADD COLUMN "stage_metadata.experiment_id" TEXT')
-        
-        # Update rows
-        for update in updates:
-            conn.execute(
-                'UPDATE benchmark_timings SET "stage_metadata.experiment_id" = ? WHERE rowid = ?',
-                (update["experiment_id"], update["idx"] + 1)  # rowid is 1-based
-            )
-        
         conn.commit()
-        print(f"Successfully updated {len(updates)} rows.")
+        print(f"Successfully updated {extracted_count} rows.")
         
     finally:
         conn.close()
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import hashlib
+import importlib.metadata
+import importlib.util
+import pickle
 import sys
 from pathlib import Path
 from typing import Any
@@ -8,12 +12,10 @@ from typing import Any
 sys.path.insert(0, str(Path(__file__).parent))
 
 import click
-import pandas as pd
 
 from tabarena.benchmark.experiment import AGModelBagExperiment, ExperimentBatchRunner
 from tabarena.nips2025_utils.end_to_end import EndToEnd
 from tabarena.nips2025_utils.tabarena_context import TabArenaContext
-from bencheval.website_format import format_leaderboard
 
 from benchmark_timer import BenchmarkTimer
 from benchmark_db import save_experiment_results
@@ -62,6 +64,66 @@ def parse_extra_metadata(metadata_args: tuple[str, ...]) -> dict[str, Any]:
     return result
 
 
+# Location of the pickled TabArena task metadata, reused across runs
+TASK_METADATA_CACHE_DIR = Path.home() / ".cache" / "tabarena"
+
+
+def _tabarena_source_key() -> str:
+    """Return a key that changes whenever the installed tabarena source changes.
+
+    tabarena is installed from a git checkout, so its version string can stay
+    the same across updates; the package location and the newest modification
+    time of its files are included as well.
+    """
+    try:
+        version = importlib.metadata.version("tabarena")
+    except importlib.metadata.PackageNotFoundError:
+        version = "unknown"
+
+    spec = importlib.util.find_spec("tabarena")
+    locations = list(spec.submodule_search_locations or []) if spec else []
+    newest = max(
+        (
+            path.stat().st_mtime_ns
+            for location in locations
+            for path in Path(location).rglob("*")
+            if path.is_file() and "__pycache__" not in path.parts
+        ),
+        default=0,
+    )
+    digest = hashlib.sha1(f"{locations}:{newest}".encode()).hexdigest()[:12]
+    return f"{version}_{digest}"
+
+
+def load_task_metadata(refresh: bool = False):
+    """Load TabArena task metadata, cached on disk per tabarena source.
+
+    Parameters
+    ----------
+    refresh : bool
+        If True, rebuild the metadata from TabArenaContext and overwrite the cache.
+
+    Returns
+    -------
+    pd.DataFrame
+        Task metadata as returned by TabArenaContext().task_metadata.
+    """
+    cache_path = TASK_METADATA_CACHE_DIR / f"task_metadata_{_tabarena_source_key()}.pkl"
+
+    if not refresh and cache_path.exists():
+        with cache_path.open("rb") as f:
+            return pickle.load(f)
+
+    task_metadata = TabArenaContext().task_metadata
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with cache_path.open("wb") as f:
+            pickle.dump(task_metadata, f)
+    except OSError:
+        pass  # caching is best effort
+    return task_metadata
+
+
 def detect_cuml_accel_active() -> bool:
     """Check if cuml.accel module is loaded."""
     return "cuml.accel" in sys.modules
@@ -97,12 +159,28 @@ def detect_cuml_accel_active() -> bool:
     help="Number of bag folds (8 was used in the TabArena 2025 paper).",
     show_default=True,
 )
+@click.option(
+    "--num-folds-parallel",
+    type=int,
+    default=None,
+    help="Fit up to this many bag folds in parallel (parallel_local). If not provided, folds "
+         "are fitted sequentially, as on every cuml.accel run, so CPU and GPU runs compare "
+         "like with like. Ignored with a warning when cuml.accel is active.",
+    show_default=True,
+)
 @click.option(
     "--ignore-cache/--use-cache",
     default=True,
     help="Whether to ignore existing caches and re-run experiments from scratch.",
     show_default=True,
 )
+@click.option(
+    "--refresh-task-metadata",
+    is_flag=True,
+    default=False,
+    help="Rebuild the cached TabArena task metadata instead of reading it from disk.",
+    show_default=True,
+)
 @click.option(
     "--skip-db-save",
     is_flag=True,
@@ -130,7 +208,9 @@ def main(
     experiment_name: str,
     time_limit: int,
     num_bag_folds: int,
+    num_folds_parallel: int | None,
     ignore_cache: bool,
+    refresh_task_metadata: bool,
     skip_db_save: bool,
     num_gpus: int | None,
     extra_metadata: tuple[str, ...],
@@ -142,6 +222,21 @@ def main(
     # Add runtime-detected cuml.accel status to metadata
     parsed_metadata["cuml_accel"] = detect_cuml_accel_active()
 
+    # Folds are fitted sequentially unless parallel folds are requested. parallel_local
+    # fits folds in Ray worker processes, which do not inherit the cuml.accel install
+    # of this process, so the request is ignored under cuml.accel
+    if num_folds_parallel is not None and parsed_metadata["cuml_accel"]:
+        click.echo(
+            "Warning: --num-folds-parallel is ignored under cuml.accel; "
+            "fitting folds sequentially.",
+            err=True,
+        )
+        num_folds_parallel = None
+    fold_fitting_strategy = "sequential_local" if num_folds_parallel is None else "parallel_local"
+
+    # Reuse child OOF predictions, skipping a refit pass; this changes the work timed per run
+    use_child_oof = True
+
     # Initialize timer for benchmarking (collects environment metadata)
     # All CLI metadata is passed directly without special treatment
     timer = BenchmarkTimer(
@@ -150,6 +245,9 @@ def main(
             "argv": sys.argv,
             "time_limit": time_limit,
             "num_bag_folds": num_bag_folds,
+            "fold_fitting_strategy": fold_fitting_strategy,
+            "num_folds_parallel": num_folds_parallel,
+            "use_child_oof": use_child_oof,
             "ignore_cache": ignore_cache,
             "num_gpus": num_gpus,
             **parsed_metadata,  # Include all extra metadata directly
@@ -162,8 +260,7 @@ def main(
         )  # folder location to save all experiment artifacts
         eval_dir = Path(__file__).parent / "eval" / "quickstart"
 
-        tabarena_context = TabArenaContext()
-        task_metadata = tabarena_context.task_metadata
+        task_metadata = load_task_metadata(refresh=refresh_task_metadata)
 
         # Parse comma-separated datasets
         dataset_list = [d.strip() for d in datasets.split(",")]
@@ -176,11 +273,13 @@ def main(
         # Build model hyperparameters
         model_hyperparameters = {
             "random_state": None,
-            "ag.ens.use_child_oof": False,
+            "ag.ens.use_child_oof": use_child_oof,
             "ag_args_ensemble": {
-                "fold_fitting_strategy": "sequential_local",
-            },  # fit folds sequentially, allowing for use of a debugger
+                "fold_fitting_strategy": fold_fitting_strategy,
+            },  # fit bag folds in parallel only when --num-folds-parallel is given
         }
+        if num_folds_parallel is not None:
+            model_hyperparameters["ag_args_ensemble"]["num_folds_parallel"] = num_folds_parallel
         # Only add ag_args_fit if num_gpus is explicitly provided
         if num_gpus is not None:
             model_hyperparameters["ag_args_fit"] = {"num_gpus": num_gpus}
@@ -226,6 +325,8 @@ def main(
         end_to_end_results = end_to_end.to_results()
 
     print(f"New Configs Hyperparameters: {end_to_end.configs_hyperparameters()}")
+    import pandas as pd
+
     with pd.option_context(
         "display.max_rows", None, "display.max_columns", None, "display.width", 1000
     ):
@@ -248,6 +349,7 @@ def main(
 
     # compare_on_tabarena: Benchmarks your model against ~50 baseline models (LightGBM, XGBoost, LogisticRegression, etc.) by fitting ALL of them on your datasets
 
+    # from bencheval.website_format import format_leaderboard
     # leaderboard: pd.DataFrame = end_to_end_results.compare_on_tabarena(
     #     output_dir=eval_dir,
     #     only_valid_tasks=True,  # True: only compare on tasks ran in `results_lst`
@@ -3,12 +3,13 @@
 
 import argparse
 import json
+import marshal
 import pstats
 import re
 import sys
 from pathlib import Path
 
-from benchmark_db import get_database_path, load_benchmark_runs, load_benchmark_timings
+from benchmark_db import get_database_path, load_run_and_timing_by_prefix
 
 
 def get_project_root() -> Path:
@@ -21,46 +22,30 @@ def lookup_profile_from_run_id(run_id: str) -> tuple[Path | None, str | None]:
 
     Returns (profile_path, error_message). If successful, error_message is None.
     """
-    db_path = get_database_path()
-    df_runs = load_benchmark_runs(db_path=db_path)
-    df_timings = load_benchmark_timings(db_path=db_path)
+    matches, has_runs, has_timings, experiment_id = load_run_and_timing_by_prefix(
+        run_id, db_path=get_database_path()
+    )
 
-    if df_runs.empty:
+    if not has_runs:
         return None, "No benchmark runs found in database."
 
-    # Match run_id by prefix
-    mask = df_runs["run_id"].str.startswith(run_id)
-    matched_runs = df_runs[mask]
-
-    if matched_runs.empty:
+    if not matches:
         return None, f"No run found with run_id starting with '{run_id}'"
 
-    if len(matched_runs) > 1:
-        run_ids = matched_runs["run_id"].tolist()
+    if len(matches) > 1:
         return None, f"Multiple runs match '{run_id}'. Please be more specific:\n" + "\n".join(
-            f"  - {rid}" for rid in run_ids
+            f"  - {rid}" for rid, _ in matches
         )
 
-    row = matched_runs.iloc[0]
-    full_run_id = row["run_id"]
+    full_run_id, datasets_json = matches[0]
 
-    # Get experiment_id from timings table
-    if df_timings.empty or "stage_metadata.experiment_id" not in df_timings.columns:
+    if not has_timings:
         return None, f"No timing data found for run '{full_run_id}'"
 
-    timing_row = df_timings[df_timings["run_id"] == full_run_id]
-    if timing_row.empty:
-        return None, f"No timing data found for run '{full_run_id}'"
-
-    experiment_id = timing_row["stage_metadata.experiment_id"].dropna().iloc[0] if not timing_row[
-        "stage_metadata.experiment_id"
-    ].dropna().empty else None
-
     if not experiment_id:
         return None, f"No experiment_id found for run '{full_run_id}'"
 
     # Get datasets
-    datasets_json = row.get("datasets")
     if not datasets_json:
         return None, f"No datasets found for run '{full_run_id}'"
 
@@ -82,6 +67,33 @@ def lookup_profile_from_run_id(run_id: str) -> tuple[Path | None, str | None]:
     return profile_path, None
 
 
+def load_stats(prof_path: Path) -> pstats.Stats:
+    """Load a .prof file with directories stripped from the function names."""
+    stats = pstats.Stats(str(prof_path))
+    stats.strip_dirs()
+    return stats
+
+
+def _load_raw_stats(prof_path: Path) -> dict[tuple, tuple]:
+    """Load a .prof file as ``{(file, line, func): (cc, nc, tt, ct)}`` without pstats.
+
+    Directories are stripped from the file names as in ``Stats.strip_dirs``,
+    and entries that collide after stripping are summed.
+    """
+    with open(prof_path, "rb") as f:
+        raw = marshal.load(f)
+
+    stats: dict[tuple, tuple] = {}
+    for func, (cc, nc, tt, ct, _callers) in raw.items():
+        key = pstats.func_strip_path(func)
+        if key in stats:
+            old_cc, old_nc, old_tt, old_ct = stats[key]
+            stats[key] = (old_cc + cc, old_nc + nc, old_tt + tt, old_ct + ct)
+        else:
+            stats[key] = (cc, nc, tt, ct)
+    return stats
+
+
 def show_profile(
     prof_path: Path,
     sort_key: str,
@@ -91,8 +103,7 @@ def show_profile(
     show_callees: str | None = None,
 ):
     """Display profile statistics with optional filtering."""
-    stats = pstats.Stats(str(prof_path))
-    stats.strip_dirs()
+    stats = load_stats(prof_path)
     stats.sort_stats(sort_key)
 
     if show_callers:
@@ -113,18 +124,20 @@ def show_profile(
 
 def list_functions(prof_path: Path, pattern: str | None = None):
     """List all functions in the profile, optionally filtered."""
-    stats = pstats.Stats(str(prof_path))
-    stats.strip_dirs()
+    # Only the raw per-function totals are needed, so skip building pstats.Stats
+    stats = _load_raw_stats(prof_path)
 
     # Get all function keys
-    func_keys = list(stats.stats.keys())
+    func_keys = list(stats.keys())
 
     print(f"\nFunctions in profile ({len(func_keys)} total):\n")
 
+    regex = re.compile(pattern, re.IGNORECASE) if pattern else None
+
     for filename, line, func_name in sorted(func_keys, key=lambda x: x[2]):
         full_name = f"{filename}:{line}({func_name})"
-        if pattern is None or re.search(pattern, full_name, re.IGNORECASE):
-            data = stats.stats[(filename, line, func_name)]
+        if regex is None or regex.search(full_name):
+            data = stats[(filename, line, func_name)]
             cumtime = data[3]  # cumulative time
             tottime = data[2]  # total time
             calls = data[0]  # number of calls
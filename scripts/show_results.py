@@ -3,22 +3,82 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
+import re
+import sqlite3
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add scripts directory to path for local module imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 import click
-import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # optional, the standard library json is used instead
+    orjson = None
 
 from benchmark_db import (
+    _connect,
+    _projection,
+    _table_columns,
     get_database_path,
     load_benchmark_runs,
     load_benchmark_timings,
+    load_model_results,
+    load_run_by_prefix,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Timing columns holding the per-run experiment config and profiling flags
+STAGE_METADATA_COLUMNS = [
+    "run_id",
+    "stage_metadata.num_gpus",
+    "stage_metadata.experiment_id",
+    "stage_metadata.cprofile",
+    "stage_metadata.cuml_accel_profile",
+]
+
+# Run columns needed to aggregate model results per dataset
+RESULTS_RUN_COLUMNS = ["run_id", "datasets", "cuda.cuda_device_count"]
+
+# Table names accepted by the query command, which interpolates them into SQL
+_TABLE_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _pandas():
+    """Import pandas with Copy-on-Write enabled.
+
+    Copy-on-Write is always on from pandas 3.0, where the option is deprecated.
+    With it, helpers can derive frames from their input without defensive copies.
+    """
+    import pandas as pd
+
+    if int(pd.__version__.split(".", 1)[0]) < 3:
+        pd.set_option("mode.copy_on_write", True)
+    return pd
+
+
+def _json_loads(text: str | bytes):
+    """Parse JSON with orjson when it is installed, else with the json module.
+
+    orjson rejects the NaN literal that json.dumps writes for missing metrics,
+    so text orjson cannot parse is retried with json.loads. Callers catch the
+    same exceptions either way.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
 
 def _parse_profiling_flags(df: pd.DataFrame) -> pd.DataFrame:
     """Parse profiling flags from stage metadata columns.
@@ -27,19 +87,16 @@ def _parse_profiling_flags(df: pd.DataFrame) -> pd.DataFrame:
     - stage_metadata.cprofile -> profiling_cprofile
     - stage_metadata.cuml_accel_profile -> profiling_cuml_accel_profile
     """
-    df = df.copy()
-
-    # Initialize default values
-    df["profiling_cprofile"] = False
-    df["profiling_cuml_accel_profile"] = False
+    # Extract from direct columns (--metadata key=value format), defaulting to False
+    flags = {}
+    for column, flag in (
+        ("stage_metadata.cprofile", "profiling_cprofile"),
+        ("stage_metadata.cuml_accel_profile", "profiling_cuml_accel_profile"),
+    ):
+        flags[flag] = df[column].fillna(False).astype(bool) if column in df.columns else False
 
-    # Extract from direct columns (--metadata key=value format)
-    if "stage_metadata.cprofile" in df.columns:
-        df["profiling_cprofile"] = df["stage_metadata.cprofile"].fillna(False).astype(bool)
-    if "stage_metadata.cuml_accel_profile" in df.columns:
-        df["profiling_cuml_accel_profile"] = df["stage_metadata.cuml_accel_profile"].fillna(False).astype(bool)
-
-    return df
+    # assign shares the unchanged columns with the input under Copy-on-Write
+    return df.assign(**flags)
 
 
 def _infer_num_gpus_from_cuda_device_count(
@@ -57,34 +114,49 @@ def _infer_num_gpus_from_cuda_device_count(
     Returns:
         DataFrame with NaN num_gpus values filled from cuda.device_count
     """
+    pd = _pandas()
+
     if "num_gpus" not in df.columns:
         return df
 
-    df = df.copy()
-
     # Get cuda.cuda_device_count from runs data
     if "cuda.cuda_device_count" in df_runs.columns:
-        cuda_device_counts = df_runs[["run_id", "cuda.cuda_device_count"]].copy()
-        cuda_device_counts = cuda_device_counts.rename(
-            columns={"cuda.cuda_device_count": "_cuda_device_count"}
-        )
-        cuda_device_counts["_cuda_device_count"] = pd.to_numeric(
-            cuda_device_counts["_cuda_device_count"], errors="coerce"
-        )
-
-        # Merge to get cuda device count per row
-        df = df.merge(cuda_device_counts, on="run_id", how="left")
+        # Look the device count up per run_id rather than merging the whole frame
+        cuda_device_counts = dict(zip(
+            df_runs["run_id"],
+            pd.to_numeric(df_runs["cuda.cuda_device_count"], errors="coerce"),
+        ))
 
         # Fill NaN num_gpus with cuda device count
-        mask = pd.isna(df["num_gpus"])
-        df.loc[mask, "num_gpus"] = df.loc[mask, "_cuda_device_count"]
-
-        # Drop temporary column
-        df = df.drop(columns=["_cuda_device_count"])
+        df = df.assign(num_gpus=df["num_gpus"].fillna(df["run_id"].map(cuda_device_counts)))
 
     return df
 
 
+def _load_and_parse(
+    conn: sqlite3.Connection, experiment: str | None, stage: str
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Load the data shared by aggregate and speedup.
+
+    Returns
+    -------
+    tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]
+        The runs, the timings of the given stage and the model results
+        (see load_model_results).
+    """
+    df_runs = load_benchmark_runs(
+        experiment_name=experiment, columns=RESULTS_RUN_COLUMNS, conn=conn
+    )
+    df_stage = load_benchmark_timings(
+        experiment_name=experiment,
+        stage=stage,
+        columns=[*STAGE_METADATA_COLUMNS, "time_s"],
+        conn=conn,
+    )
+    df_results = load_model_results(experiment_name=experiment, conn=conn)
+    return df_runs, df_stage, df_results
+
+
 @click.group()
 @click.option(
     "--db",
@@ -103,37 +175,62 @@ def cli(ctx, db_path: Path | None):
         click.echo(f"Database not found: {ctx.obj['db_path']}", err=True)
         ctx.exit(1)
 
+    # One read-only connection shared by the loaders, closed when the command ends
+    conn = _connect(ctx.obj["db_path"], read_only=True)
+    ctx.obj["conn"] = conn
+    ctx.call_on_close(conn.close)
+
 
-def _detect_cprofile_from_disk(experiment_name: str, datasets_json: str | None, db_path: Path) -> bool:
-    """Check if cProfile data exists on disk for the experiment.
+@functools.lru_cache(maxsize=8)
+def _cprofile_index(cprofiles_dir: str) -> frozenset[str]:
+    """Return the ``{experiment_id}/{dataset}.prof`` keys of the cProfile files on disk.
+
+    The cprofiles directory is scanned once, two levels deep, instead of
+    checking one path per run, and the result is cached per directory.
+    """
+    index: set[str] = set()
+    try:
+        with os.scandir(cprofiles_dir) as experiment_dirs:
+            for experiment_dir in experiment_dirs:
+                if not experiment_dir.is_dir():
+                    continue
+                with os.scandir(experiment_dir.path) as files:
+                    index.update(
+                        f"{experiment_dir.name}/{f.name}" for f in files if f.name.endswith(".prof")
+                    )
+    except FileNotFoundError:
+        pass
+    return frozenset(index)
+
+
+def _detect_cprofile_from_disk(df: pd.DataFrame, db_path: Path) -> pd.Series:
+    """Check if cProfile data exists on disk for each run.
 
     cProfile files are stored in cprofiles/{experiment_id}/{dataset}.prof
-    where experiment_name is typically {experiment_id}_{dataset}.
+    where experiment_name is typically {experiment_id}_{dataset}, and dataset
+    is the first entry of the run's datasets (the ``_first_dataset`` column).
+
+    Returns
+    -------
+    pd.Series
+        Boolean Series aligned with df.
     """
-    if not experiment_name or not datasets_json:
-        return False
+    pd = _pandas()
 
-    # Parse datasets from JSON
-    try:
-        datasets = json.loads(datasets_json)
-        if not datasets:
-            return False
-        dataset = datasets[0]  # Typically one dataset per run
-    except (json.JSONDecodeError, IndexError, TypeError):
-        return False
-
-    # Extract experiment_id from experiment_name (format: {experiment_id}_{dataset})
-    # The experiment_id is the part before the dataset name
-    if f"_{dataset}" in experiment_name:
-        experiment_id = experiment_name.rsplit(f"_{dataset}", 1)[0]
-    else:
-        # Fallback: use the whole experiment name
-        experiment_id = experiment_name
+    detected = pd.Series(False, index=df.index)
+    profiles = _cprofile_index(str(db_path.parent / "cprofiles"))
+    if not profiles or "_first_dataset" not in df.columns:
+        return detected
 
-    # Check if cprofile file exists
-    project_root = db_path.parent
-    cprofile_path = project_root / "cprofiles" / experiment_id / f"{dataset}.prof"
-    return cprofile_path.exists()
+    # There are few distinct datasets, so build the candidate paths per dataset
+    experiment_names = df["experiment_name"].fillna("")
+    for dataset, names in experiment_names.groupby(df["_first_dataset"], sort=False):
+        # The experiment_id is the part before the dataset name, else the whole name
+        parts = names.str.rpartition(f"_{dataset}")
+        experiment_ids = parts[0].where(parts[1] != "", names)
+        keys = experiment_ids + f"/{dataset}.prof"
+        detected[names.index] = keys.isin(profiles) & (names != "")
+    return detected
 
 
 @cli.command()
@@ -149,25 +246,46 @@ def _detect_cprofile_from_disk(experiment_name: str, datasets_json: str | None,
 @click.pass_context
 def runs(ctx, experiment: str | None, limit: int, as_json: bool, no_infer_gpu_count: bool):
     """List benchmark runs with summary info."""
-    df = load_benchmark_runs(experiment_name=experiment, db_path=ctx.obj["db_path"])
+    pd = _pandas()
+
+    conn = ctx.obj["conn"]
+    df = load_benchmark_runs(
+        experiment_name=experiment,
+        columns=[
+            "run_id",
+            "experiment_name",
+            "execution_datetime",
+            "total_time_s",
+            "datasets",
+            "system.hostname",
+            "cuda.cuda_device_count",
+        ],
+        conn=conn,
+    )
 
     if df.empty:
         click.echo("No benchmark runs found.")
         return
 
-    # Load timing data to get num_gpus and profiling flags
-    df_timings = load_benchmark_timings(experiment_name=experiment, db_path=ctx.obj["db_path"])
+    # Only the displayed runs need their timing data
+    total_runs = len(df)
+    df = df.head(limit)
+
+    # Load timing data to get num_gpus and profiling flags from model_fit stage
+    df_timings = load_benchmark_timings(
+        run_ids=df["run_id"].tolist(),
+        stage="model_fit",
+        columns=STAGE_METADATA_COLUMNS,
+        conn=conn,
+    )
 
     # Extract num_gpus and profiling flags from model_fit stage
     if not df_timings.empty:
-        df_stage = df_timings[df_timings["stage"] == "model_fit"].copy()
-        df_stage = _parse_profiling_flags(df_stage)
+        df_stage = _parse_profiling_flags(df_timings)
 
         # Rename num_gpus column if present
         if "stage_metadata.num_gpus" in df_stage.columns:
             df_stage = df_stage.rename(columns={"stage_metadata.num_gpus": "num_gpus"})
-            # Convert to numeric (may be stored as string due to SQLite/pandas type handling)
-            df_stage["num_gpus"] = pd.to_numeric(df_stage["num_gpus"], errors="coerce")
 
         # Rename experiment_id column if present
         if "stage_metadata.experiment_id" in df_stage.columns:
@@ -184,7 +302,10 @@ def runs(ctx, experiment: str | None, limit: int, as_json: bool, no_infer_gpu_co
         if "profiling_cuml_accel_profile" in df_stage.columns:
             merge_cols.append("profiling_cuml_accel_profile")
 
-        df_stage_subset = df_stage[merge_cols].drop_duplicates(subset=["run_id"])
+        # model_fit is normally timed once per run, so only collapse when it was not
+        df_stage_subset = df_stage[merge_cols]
+        if not df_stage_subset["run_id"].is_unique:
+            df_stage_subset = df_stage_subset.groupby("run_id", sort=False, as_index=False).first()
         df = df.merge(df_stage_subset, on="run_id", how="left")
 
         # Infer num_gpus from cuda.device_count if not set (enabled by default)
@@ -192,16 +313,11 @@ def runs(ctx, experiment: str | None, limit: int, as_json: bool, no_infer_gpu_co
             df = _infer_num_gpus_from_cuda_device_count(df, df)
 
     # Detect cProfile from disk if not already set (external cProfile invocation)
-    db_path = ctx.obj["db_path"]
     if "profiling_cprofile" not in df.columns:
         df["profiling_cprofile"] = False
-    df["profiling_cprofile"] = df.apply(
-        lambda row: row.get("profiling_cprofile", False) or _detect_cprofile_from_disk(
-            row.get("experiment_name", ""),
-            row.get("datasets"),
-            db_path
-        ),
-        axis=1
+    df["profiling_cprofile"] = (
+        df["profiling_cprofile"].fillna(False).astype(bool)
+        | _detect_cprofile_from_disk(df, ctx.obj["db_path"])
     )
 
     # Select key columns for display
@@ -218,17 +334,18 @@ def runs(ctx, experiment: str | None, limit: int, as_json: bool, no_infer_gpu_co
     ]
     available_cols = [c for c in display_cols if c in df.columns]
 
-    df_display = df[available_cols].head(limit)
+    df_display = df[available_cols]
 
     if as_json:
         click.echo(df_display.to_json(orient="records", indent=2))
     else:
         # Truncate long strings for display
-        df_display = df_display.copy()
-        if "run_id" in df_display.columns:
-            df_display["run_id"] = df_display["run_id"].str[:8]
-        if "experiment_id" in df_display.columns:
-            df_display["experiment_id"] = df_display["experiment_id"].str[:8]
+        truncated = {
+            col: df_display[col].str[:8]
+            for col in ("run_id", "experiment_id")
+            if col in df_display.columns
+        }
+        df_display = df_display.assign(**truncated)
 
         with pd.option_context(
             "display.max_columns", None,
@@ -237,8 +354,8 @@ def runs(ctx, experiment: str | None, limit: int, as_json: bool, no_infer_gpu_co
         ):
             click.echo(df_display.to_string(index=False))
 
-        if len(df) > limit:
-            click.echo(f"\n... showing {limit} of {len(df)} runs (use -n to show more)")
+        if total_runs > limit:
+            click.echo(f"\n... showing {limit} of {total_runs} runs (use -n to show more)")
 
 
 @cli.command()
@@ -250,16 +367,14 @@ def timings(ctx, run_id: str, as_json: bool):
 
     RUN_ID can be a partial match (prefix).
     """
-    # Load all timings and filter by run_id prefix
-    df = load_benchmark_timings(db_path=ctx.obj["db_path"])
+    pd = _pandas()
 
-    if df.empty:
-        click.echo("No timing data found.")
-        return
-
-    # Filter by run_id prefix
-    mask = df["run_id"].str.startswith(run_id)
-    df_filtered = df[mask]
+    # Load only the timings whose run_id matches the prefix
+    df_filtered = load_benchmark_timings(
+        run_id_prefix=run_id,
+        columns=["run_id", "experiment_name", "stage", "time_ms", "time_s", "timestamp"],
+        conn=ctx.obj["conn"],
+    )
 
     if df_filtered.empty:
         click.echo(f"No timings found for run_id starting with '{run_id}'")
@@ -291,15 +406,10 @@ def info(ctx, run_id: str, as_json: bool, category: str | None):
 
     RUN_ID can be a partial match (prefix).
     """
-    df = load_benchmark_runs(db_path=ctx.obj["db_path"])
+    pd = _pandas()
 
-    if df.empty:
-        click.echo("No benchmark runs found.")
-        return
-
-    # Filter by run_id prefix
-    mask = df["run_id"].str.startswith(run_id)
-    df_filtered = df[mask]
+    # Two rows are enough to tell a unique match from an ambiguous prefix
+    df_filtered = load_run_by_prefix(run_id, conn=ctx.obj["conn"])
 
     if df_filtered.empty:
         click.echo(f"No run found with run_id starting with '{run_id}'")
@@ -331,15 +441,20 @@ def info(ctx, run_id: str, as_json: bool, category: str | None):
 
         # Group by prefix
         groups: dict[str, dict] = {}
-        for k, v in sorted(row.items()):
-            if "." in k:
-                prefix, key = k.split(".", 1)
-                groups.setdefault(prefix, {})[key] = v
-            else:
-                groups.setdefault("general", {})[k] = v
+        if category:
+            # Only the category's keys are left, so strip the known prefix instead of splitting
+            groups["general"] = {k: v for k, v in row.items() if not k.startswith(prefix)}
+            groups[category] = {k[len(prefix):]: v for k, v in row.items() if k.startswith(prefix)}
+        else:
+            for k, v in row.items():
+                if "." in k:
+                    group_name, key = k.split(".", 1)
+                    groups.setdefault(group_name, {})[key] = v
+                else:
+                    groups.setdefault("general", {})[k] = v
 
         for group_name, group_data in sorted(groups.items()):
-            if category and group_name != category and group_name != "general":
+            if not group_data:
                 continue
             click.echo(f"\n[{group_name}]")
             for k, v in sorted(group_data.items()):
@@ -354,23 +469,24 @@ def info(ctx, run_id: str, as_json: bool, category: str | None):
 @click.pass_context
 def tables(ctx):
     """List all tables in the database."""
-    import sqlite3
-
-    with sqlite3.connect(ctx.obj["db_path"]) as conn:
-        cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        tables = [row[0] for row in cursor.fetchall()]
+    conn = ctx.obj["conn"]
+    cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    tables = [row[0] for row in cursor.fetchall()]
 
     if not tables:
         click.echo("No tables found in database.")
         return
 
+    # Count every table in one statement on the same connection
+    escaped_names = [table.replace('"', '""') for table in tables]
+    counts_query = " UNION ALL ".join(
+        f'SELECT ?, COUNT(*) FROM "{name}"' for name in escaped_names
+    )
+    counts = dict(conn.execute(counts_query, tables).fetchall())
+
     click.echo("Tables in database:")
     for table in tables:
-        # Get row count
-        with sqlite3.connect(ctx.obj["db_path"]) as conn:
-            cursor = conn.execute(f"SELECT COUNT(*) FROM '{table}'")
-            count = cursor.fetchone()[0]
-        click.echo(f"  - {table} ({count} rows)")
+        click.echo(f"  - {table} ({counts[table]} rows)")
 
 
 @cli.command()
@@ -379,12 +495,29 @@ def tables(ctx):
 @click.pass_context
 def query(ctx, table_name: str, limit: int):
     """Show raw data from a specific table."""
-    import sqlite3
+    pd = _pandas()
+
+    if not _TABLE_NAME_RE.match(table_name):
+        click.echo(f"Invalid table name '{table_name}'.", err=True)
+        return
 
+    conn = ctx.obj["conn"]
+    max_columns = 10
     try:
-        with sqlite3.connect(ctx.obj["db_path"]) as conn:
-            df = pd.read_sql(f"SELECT * FROM '{table_name}' LIMIT {limit}", conn)
-    except pd.io.sql.DatabaseError as e:
+        cursor = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name = ?", (table_name,)
+        )
+        if cursor.fetchone() is None:
+            click.echo(f"Table '{table_name}' not found.", err=True)
+            return
+        columns = _table_columns(conn, table_name)
+        # Only the columns that fit in the display are read, straight from the cursor
+        cursor = conn.execute(
+            f'SELECT {_projection(columns[:max_columns])} FROM "{table_name}" LIMIT ?',
+            (limit,),
+        )
+        df = pd.DataFrame(cursor.fetchall(), columns=[d[0] for d in cursor.description])
+    except sqlite3.Error as e:
         click.echo(f"Error querying table '{table_name}': {e}", err=True)
         return
 
@@ -393,13 +526,15 @@ def query(ctx, table_name: str, limit: int):
         return
 
     with pd.option_context(
-        "display.max_columns", 10,
+        "display.max_columns", max_columns,
         "display.width", 200,
         "display.max_colwidth", 30,
     ):
         click.echo(df.to_string(index=False))
 
-    click.echo(f"\nColumns: {', '.join(df.columns.tolist())}")
+    if len(columns) > max_columns:
+        click.echo(f"\n(Showing the first {max_columns} of {len(columns)} columns)")
+    click.echo(f"\nColumns: {', '.join(columns)}")
 
 
 @cli.command()
@@ -412,15 +547,14 @@ def results(ctx, run_id: str, as_json: bool):
     RUN_ID can be a partial match (prefix).
     Displays the model results stored from end_to_end_results.model_results.
     """
-    df = load_benchmark_runs(db_path=ctx.obj["db_path"])
-
-    if df.empty:
-        click.echo("No benchmark runs found.")
-        return
+    pd = _pandas()
 
-    # Filter by run_id prefix
-    mask = df["run_id"].str.startswith(run_id)
-    df_filtered = df[mask]
+    # Two rows are enough to tell a unique match from an ambiguous prefix
+    df_filtered = load_run_by_prefix(
+        run_id,
+        conn=ctx.obj["conn"],
+        columns=["run_id", "experiment_name", "datasets", "results_json"],
+    )
 
     if df_filtered.empty:
         click.echo(f"No run found with run_id starting with '{run_id}'")
@@ -442,8 +576,8 @@ def results(ctx, run_id: str, as_json: bool):
         output = {
             "run_id": row["run_id"],
             "experiment_name": row.get("experiment_name", "N/A"),
-            "datasets": json.loads(datasets) if datasets and datasets != "N/A" else None,
-            "results": json.loads(results_json) if results_json else None,
+            "datasets": _json_loads(datasets) if datasets and datasets != "N/A" else None,
+            "results": _json_loads(results_json) if results_json else None,
         }
         click.echo(json.dumps(output, indent=2, default=str))
     else:
@@ -454,7 +588,7 @@ def results(ctx, run_id: str, as_json: bool):
 
         if results_json:
             try:
-                results_dict = json.loads(results_json)
+                results_dict = _json_loads(results_json)
                 # Convert to DataFrame for nice display
                 df_results = pd.DataFrame(results_dict)
                 with pd.option_context(
@@ -504,17 +638,15 @@ def aggregate(ctx, experiment: str | None, stage: str, as_json: bool, include_pr
     By default, runs with cProfile or cuml.accel --profile enabled are excluded
     to avoid skewed timing results. Use --include-profiled to include them.
     """
-    # Load runs and timings
-    df_runs = load_benchmark_runs(experiment_name=experiment, db_path=ctx.obj["db_path"])
-    df_timings = load_benchmark_timings(experiment_name=experiment, db_path=ctx.obj["db_path"])
+    pd = _pandas()
+
+    # Load runs, the timings of the specified stage and the model results
+    df_runs, df_stage, df_results = _load_and_parse(ctx.obj["conn"], experiment, stage)
 
-    if df_runs.empty or df_timings.empty:
+    if df_runs.empty:
         click.echo("No benchmark data found.")
         return
 
-    # Filter timings for the specified stage
-    df_stage = df_timings[df_timings["stage"] == stage].copy()
-
     # Filter out profiled runs unless explicitly included
     if not include_profiled:
         df_stage = _parse_profiling_flags(df_stage)
@@ -532,42 +664,22 @@ def aggregate(ctx, experiment: str | None, stage: str, as_json: bool, include_pr
     # Use num_gpus from stage_metadata (experiment config), rename for clarity
     if "stage_metadata.num_gpus" in df_stage.columns:
         df_stage = df_stage.rename(columns={"stage_metadata.num_gpus": "num_gpus"})
-        # Convert to numeric (may be stored as string due to SQLite/pandas type handling)
-        df_stage["num_gpus"] = pd.to_numeric(df_stage["num_gpus"], errors="coerce")
 
     # Infer num_gpus from cuda.device_count if not set (enabled by default)
     if not no_infer_gpu_count and "num_gpus" in df_stage.columns:
         df_stage = _infer_num_gpus_from_cuda_device_count(df_stage, df_runs)
 
-    # Extract time_train_s and time_infer_s from results_json
-    results_data = []
-    for _, row in df_runs.iterrows():
-        results_json = row.get("results_json")
-        if results_json:
-            try:
-                results_dict = json.loads(results_json)
-                # results_dict is in column-oriented format, extract values
-                time_train_values = results_dict.get("time_train_s", {})
-                time_infer_values = results_dict.get("time_infer_s", {})
-                # Each key is a row index, get all values
-                for idx in time_train_values.keys():
-                    results_data.append({
-                        "run_id": row["run_id"],
-                        "time_train_s": time_train_values.get(idx),
-                        "time_infer_s": time_infer_values.get(idx),
-                    })
-            except (json.JSONDecodeError, ValueError, TypeError):
-                pass
-
-    df_results = pd.DataFrame(results_data) if results_data else pd.DataFrame()
-
-    # Merge with runs to get datasets
-    df_runs_subset = df_runs[["run_id", "datasets"]].copy()
-    df_merged = df_stage.merge(df_runs_subset, on="run_id", how="left")
+    # Join with runs on the run_id index to get datasets
+    df_merged = df_stage.set_index("run_id").join(
+        df_runs.set_index("run_id")[["datasets"]], how="left"
+    )
 
-    # Merge results timing data
+    # Join results timing data
     if not df_results.empty:
-        df_merged = df_merged.merge(df_results, on="run_id", how="left")
+        df_merged = df_merged.join(df_results.set_index("run_id"), how="left")
+
+    # datasets is a low-cardinality JSON string, so group on categories instead
+    df_merged["datasets"] = df_merged["datasets"].astype("category")
 
     # Determine groupby columns based on what's available
     groupby_cols = ["datasets"]
@@ -586,7 +698,7 @@ def aggregate(ctx, experiment: str | None, stage: str, as_json: bool, include_pr
 
     # Group by datasets and num_gpus, compute median
     df_agg = (
-        df_merged.groupby(groupby_cols, dropna=False)
+        df_merged.groupby(groupby_cols, dropna=False, observed=True)
         .agg(**agg_dict)
         .reset_index()
     )
@@ -616,6 +728,9 @@ DATASET_SIZES = {
     '["customer_satisfaction_in_airline"]': (86586, 21),
     '["diabetes"]': (512, 8),
 }
+# Plain dicts let Series.map look sizes up without a Python callback per row
+DATASET_ROWS = {datasets: rows for datasets, (rows, _cols) in DATASET_SIZES.items()}
+DATASET_COLS = {datasets: cols for datasets, (_rows, cols) in DATASET_SIZES.items()}
 
 
 @cli.command()
@@ -649,17 +764,16 @@ def speedup(ctx, experiment: str | None, as_json: bool, include_profiled: bool,
     By default, runs with cProfile or cuml.accel --profile enabled are excluded
     to avoid skewed timing results. Use --include-profiled to include them.
     """
-    # Load runs and timings
-    df_runs = load_benchmark_runs(experiment_name=experiment, db_path=ctx.obj["db_path"])
-    df_timings = load_benchmark_timings(experiment_name=experiment, db_path=ctx.obj["db_path"])
+    pd = _pandas()
 
-    if df_runs.empty or df_timings.empty:
+    # Load runs, the model_fit stage for filtering profiled runs and getting num_gpus,
+    # and the model results
+    df_runs, df_stage, df_results = _load_and_parse(ctx.obj["conn"], experiment, "model_fit")
+
+    if df_runs.empty:
         click.echo("No benchmark data found.")
         return
 
-    # Use model_fit stage for filtering profiled runs and getting num_gpus
-    df_stage = df_timings[df_timings["stage"] == "model_fit"].copy()
-
     # Filter out profiled runs unless explicitly included
     if not include_profiled:
         df_stage = _parse_profiling_flags(df_stage)
@@ -682,48 +796,28 @@ def speedup(ctx, experiment: str | None, as_json: bool, include_profiled: bool,
         click.echo("No num_gpus data found in timing metadata.")
         return
 
-    # Convert num_gpus to numeric (may be stored as string due to SQLite/pandas type handling)
-    df_stage["num_gpus"] = pd.to_numeric(df_stage["num_gpus"], errors="coerce")
-
     # Infer num_gpus from cuda.device_count if not set (enabled by default)
     if not no_infer_gpu_count:
         df_stage = _infer_num_gpus_from_cuda_device_count(df_stage, df_runs)
 
-    # Extract time_train_s and time_infer_s from results_json
-    results_data = []
-    for _, row in df_runs.iterrows():
-        results_json = row.get("results_json")
-        if results_json:
-            try:
-                results_dict = json.loads(results_json)
-                time_train_values = results_dict.get("time_train_s", {})
-                time_infer_values = results_dict.get("time_infer_s", {})
-                for idx in time_train_values.keys():
-                    results_data.append({
-                        "run_id": row["run_id"],
-                        "time_train_s": time_train_values.get(idx),
-                        "time_infer_s": time_infer_values.get(idx),
-                    })
-            except (json.JSONDecodeError, ValueError, TypeError):
-                pass
-
-    if not results_data:
+    if df_results.empty:
         click.echo("No model results data found.")
         return
 
-    df_results = pd.DataFrame(results_data)
-
-    # Merge with runs to get datasets, and with stage to get num_gpus
-    # Use inner merge with df_stage_subset to exclude profiled runs (already filtered out of df_stage)
-    df_runs_subset = df_runs[["run_id", "datasets"]].copy()
-    df_stage_subset = df_stage[["run_id", "num_gpus"]].copy()
+    # Join with runs to get datasets, and with stage to get num_gpus, on the run_id index
+    # Use an inner join with the stage to exclude profiled runs (already filtered out of df_stage)
+    df_merged = (
+        df_results.set_index("run_id")
+        .join(df_runs.set_index("run_id")[["datasets"]], how="left")
+        .join(df_stage.set_index("run_id")[["num_gpus"]], how="inner")
+    )
 
-    df_merged = df_results.merge(df_runs_subset, on="run_id", how="left")
-    df_merged = df_merged.merge(df_stage_subset, on="run_id", how="inner")
+    # datasets is a low-cardinality JSON string, so group on categories instead
+    df_merged["datasets"] = df_merged["datasets"].astype("category")
 
     # Group by datasets and num_gpus, compute aggregate
     df_agg = (
-        df_merged.groupby(["datasets", "num_gpus"], dropna=False)
+        df_merged.groupby(["datasets", "num_gpus"], dropna=False, observed=True)
         .agg(
             agg_time_train_s=("time_train_s", agg),
             agg_time_infer_s=("time_infer_s", agg),
@@ -733,7 +827,7 @@ def speedup(ctx, experiment: str | None, as_json: bool, include_profiled: bool,
     )
 
     # Extract baseline (num_gpus == 0) timing for each dataset
-    df_baseline = df_agg[df_agg["num_gpus"] == 0][["datasets", "agg_time_train_s", "agg_time_infer_s"]].copy()
+    df_baseline = df_agg[df_agg["num_gpus"] == 0][["datasets", "agg_time_train_s", "agg_time_infer_s"]]
     df_baseline = df_baseline.rename(columns={
         "agg_time_train_s": "baseline_train_s",
         "agg_time_infer_s": "baseline_infer_s",
@@ -751,15 +845,17 @@ def speedup(ctx, experiment: str | None, as_json: bool, include_profiled: bool,
     df_speedup["speedup_infer"] = df_speedup["baseline_infer_s"] / df_speedup["agg_time_infer_s"]
 
     # Filter out baseline rows (speedup would always be 1.0)
-    df_speedup = df_speedup[df_speedup["num_gpus"] != 0].copy()
+    df_speedup = df_speedup[df_speedup["num_gpus"] != 0]
 
     if df_speedup.empty:
         click.echo("No GPU runs found to compare against baseline.")
         return
 
     # Add dataset size information
-    df_speedup["rows"] = df_speedup["datasets"].map(lambda x: DATASET_SIZES.get(x, (None, None))[0])
-    df_speedup["cols"] = df_speedup["datasets"].map(lambda x: DATASET_SIZES.get(x, (None, None))[1])
+    # Mapped as plain strings, so rows and cols come out numeric rather than categorical
+    datasets = df_speedup["datasets"].astype(object)
+    df_speedup["rows"] = datasets.map(DATASET_ROWS)
+    df_speedup["cols"] = datasets.map(DATASET_COLS)
 
     # Sort by datasets and num_gpus
     df_speedup = df_speedup.sort_values(["datasets", "num_gpus"])
@@ -801,12 +897,14 @@ def paths(ctx, id: str, as_json: bool):
     ID can be either a run_id or experiment_id (partial prefix match supported).
     Auto-detects the ID type and displays relevant file paths.
     """
+    pd = _pandas()
+
     db_path = ctx.obj["db_path"]
     project_root = db_path.parent
 
     # Load data to detect ID type
-    df_runs = load_benchmark_runs(db_path=db_path)
-    df_timings = load_benchmark_timings(db_path=db_path)
+    df_runs = load_benchmark_runs(conn=ctx.obj["conn"])
+    df_timings = load_benchmark_timings(conn=ctx.obj["conn"])
 
     if df_runs.empty:
         click.echo("No benchmark runs found.")
@@ -845,7 +943,7 @@ def paths(ctx, id: str, as_json: bool):
         datasets_json = run_row.get("datasets")
         if datasets_json:
             try:
-                datasets_list = json.loads(datasets_json)
+                datasets_list = _json_loads(datasets_json)
                 datasets_set.update(datasets_list)
             except (json.JSONDecodeError, TypeError):
                 pass
@@ -879,7 +977,7 @@ def paths(ctx, id: str, as_json: bool):
                         datasets_json = run_row.iloc[0].get("datasets")
                         if datasets_json:
                             try:
-                                datasets_list = json.loads(datasets_json)
+                                datasets_list = _json_loads(datasets_json)
                                 datasets_set.update(datasets_list)
                             except (json.JSONDecodeError, TypeError):
                                 pass
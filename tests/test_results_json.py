@@ -0,0 +1,69 @@
+"""Tests for reading model results whose results_json holds NaN values."""
+
+from __future__ import annotations
+
+import json
+import math
+import sqlite3
+import sys
+from pathlib import Path
+
+# Add scripts directory to path for local module imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from benchmark_db import load_model_results
+
+
+def _make_db(tmp_path: Path) -> Path:
+    """Create a benchmark_runs table with NaN-bearing, plain and malformed runs."""
+    db_path = tmp_path / "benchmark_results.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE benchmark_runs (run_id TEXT, experiment_name TEXT, results_json TEXT)"
+    )
+    rows = [
+        # json.dumps writes a bare NaN, which SQLite's json_valid rejects
+        ("run_nan", "exp", json.dumps({
+            "time_train_s": {"0": 1.0, "1": 2.0},
+            "time_infer_s": {"0": 0.5, "1": float("nan")},
+        })),
+        ("run_ok", "exp", json.dumps({
+            "time_train_s": {"0": 3.0},
+            "time_infer_s": {"0": 1.5},
+        })),
+        ("run_bad", "exp", "{not json"),
+    ]
+    conn.executemany("INSERT INTO benchmark_runs VALUES (?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+def test_load_model_results_keeps_runs_with_nan(tmp_path):
+    df = load_model_results(experiment_name="exp", db_path=_make_db(tmp_path))
+
+    df = df.sort_values(["run_id", "time_train_s"]).reset_index(drop=True)
+    assert df["run_id"].tolist() == ["run_nan", "run_nan", "run_ok"]
+    assert df["time_train_s"].tolist() == [1.0, 2.0, 3.0]
+    assert df["time_infer_s"].iloc[0] == 0.5
+    assert math.isnan(df["time_infer_s"].iloc[1])
+    assert df["time_infer_s"].iloc[2] == 1.5
+
+
+def test_results_command_reads_nan(tmp_path):
+    from click.testing import CliRunner
+
+    from show_results import _json_loads, cli
+
+    assert math.isnan(_json_loads('{"a": NaN}')["a"])
+
+    db_path = _make_db(tmp_path)
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["--db", str(db_path), "results", "run_nan", "--json"])
+    assert result.exit_code == 0, result.output
+    assert '"1": NaN' in result.output
+
+    result = runner.invoke(cli, ["--db", str(db_path), "results", "run_nan"])
+    assert result.exit_code == 0, result.output
+    assert "Error parsing results" not in result.output